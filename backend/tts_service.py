@@ -4,6 +4,7 @@ import os
 import asyncio
 import hashlib
 import json
+import time
 from pathlib import Path
 from typing import Optional, Tuple, Dict
 import edge_tts
@@ -20,9 +21,13 @@ class TTSService:
     Based on: TTS_System_Documentation.md
     """
 
+    # How long the downloaded voice list stays valid on disk (seconds)
+    VOICES_CACHE_TTL = 24 * 60 * 60
+
     def __init__(self):
         self.cache_file = Path(settings.CACHE_DIR) / "tts_cache.json"
         self.cache_mapping = self._load_cache()
+        self.voices_cache_file = Path(settings.CACHE_DIR) / "voices_cache.json"
 
         # Proxy configuration
         self.proxy_enabled = settings.TTS_PROXY_ENABLED
@@ -73,6 +78,30 @@ class TTSService:
         except Exception as e:
             logger.error(f"Could not save cache: {e}")
 
+    def _load_voices_cache(self) -> Optional[list]:
+        """Load the raw edge-tts voice list from disk if it is younger than VOICES_CACHE_TTL"""
+        try:
+            age = time.time() - self.voices_cache_file.stat().st_mtime
+            if age < self.VOICES_CACHE_TTL:
+                with open(self.voices_cache_file, 'r') as f:
+                    return json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not load voices cache: {e}")
+        return None
+
+    def _save_voices_cache(self, voices: list):
+        """Save the raw edge-tts voice list to disk (atomically)"""
+        try:
+            self.voices_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.voices_cache_file.with_name(self.voices_cache_file.name + ".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(voices, f)
+            os.replace(tmp_file, self.voices_cache_file)
+        except Exception as e:
+            logger.warning(f"Could not save voices cache: {e}")
+
     async def check_tts_connectivity(self) -> Dict[str, any]:
         """
         Check connectivity to TTS service with and without proxy
@@ -657,58 +686,70 @@ class TTSService:
         """
         Get list of available voices with retry logic
         Handles different edge-tts API versions and structures
+        The raw voice list is cached on disk for VOICES_CACHE_TTL seconds
         """
         try:
-            logger.info("Fetching available voices...")
+            voices = self._load_voices_cache() if settings.TTS_CACHE_ENABLED else None
 
-            # Try different API methods (edge-tts API has changed over versions)
-            try:
-                # New API (edge-tts >= 6.0.0)
-                from edge_tts import VoicesManager
-                voices_manager = await VoicesManager.create()
-                voices = voices_manager.voices
-            except (ImportError, AttributeError):
-                # Old API (edge-tts < 6.0.0)
-                voices = await edge_tts.list_voices()
+            if voices is not None:
+                logger.debug("Using cached voice list")
+            else:
+                logger.info("Fetching available voices...")
+
+                # Try different API methods (edge-tts API has changed over versions)
+                try:
+                    # New API (edge-tts >= 6.0.0)
+                    from edge_tts import VoicesManager
+                    voices_manager = await VoicesManager.create()
+                    voices = voices_manager.voices
+                except (ImportError, AttributeError):
+                    # Old API (edge-tts < 6.0.0)
+                    voices = await edge_tts.list_voices()
+
+                if voices and settings.TTS_CACHE_ENABLED:
+                    self._save_voices_cache(voices)
 
             if not voices:
                 logger.warning("No voices returned from edge-tts")
                 return []
 
             voice_list = []
+            # Hoisted out of the loop: the filter prefix is the same for every voice
+            lang_prefix = language.lower() if language else None
 
             for voice in voices:
                 try:
+                    get = voice.get
                     # Handle different voice dict structures
                     # Try multiple key names that different versions use
-                    locale = voice.get('Locale') or voice.get('locale') or voice.get('Language')
+                    locale = get('Locale') or get('locale') or get('Language')
 
                     if not locale:
                         continue
 
                     # Filter by language if specified
-                    if language and not locale.lower().startswith(language.lower()):
+                    if lang_prefix and not locale.lower().startswith(lang_prefix):
                         continue
 
                     # Extract voice information with fallbacks
                     friendly_name = (
-                        voice.get('FriendlyName') or
-                        voice.get('Name') or
-                        voice.get('DisplayName') or
-                        voice.get('ShortName') or
+                        get('FriendlyName') or
+                        get('Name') or
+                        get('DisplayName') or
+                        get('ShortName') or
                         'Unknown'
                     )
 
                     short_name = (
-                        voice.get('ShortName') or
-                        voice.get('Name') or
-                        voice.get('FriendlyName') or
+                        get('ShortName') or
+                        get('Name') or
+                        get('FriendlyName') or
                         'Unknown'
                     )
 
                     gender = (
-                        voice.get('Gender') or
-                        voice.get('VoiceGender') or
+                        get('Gender') or
+                        get('VoiceGender') or
                         'Unknown'
                     )
 
@@ -450,13 +450,9 @@ class ExportPipeline:
 
         logger.info(f"Checking availability of {len(required_fonts)} font(s)...")
 
-        # Ensure each font is available
-        for font_name in required_fonts:
-            try:
-                FontManager.ensure_font_available(font_name)
-            except Exception as e:
-                logger.warning(f"Could not ensure font '{font_name}' is available: {e}")
-                logger.warning(f"Video will use system default font instead of '{font_name}'")
+        # Ensure all fonts are available (installed concurrently, one font cache update);
+        # FontManager warns about each font that falls back to the system default
+        FontManager.ensure_fonts_available(required_fonts)
 
     def _get_subtitle_style(self, segment) -> dict:
         """Get subtitle style options for segment"""
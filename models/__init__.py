@@ -1,7 +1,27 @@
 """Data models for the TermiVoxed"""
 
-from .segment import Segment
-from .timeline import Timeline
-from .project import Project
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .segment import Segment
+    from .timeline import Timeline
+    from .project import Project
 
 __all__ = ["Segment", "Timeline", "Project"]
+
+# Submodule providing each public name; imported on first access so that
+# importing a single model (e.g. models.video) doesn't load the ffmpeg backend
+_LAZY_IMPORTS = {
+    "Segment": ".segment",
+    "Timeline": ".timeline",
+    "Project": ".project",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
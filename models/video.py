@@ -4,24 +4,54 @@ Video Model - Represents a single video in a multi-video project
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict
+from enum import IntEnum
+from typing import Optional, Dict, TYPE_CHECKING
 from uuid import uuid4
 from pathlib import Path
 
-from models.timeline import Timeline
+from utils.logger import logger
 
+if TYPE_CHECKING:
+    from models.timeline import Timeline
 
-@dataclass
+
+class Orientation(IntEnum):
+    """Video orientation code, used to compare orientations"""
+
+    HORIZONTAL = 0
+    VERTICAL = 1
+    SQUARE = 2
+
+    @classmethod
+    def parse(cls, value) -> Optional['Orientation']:
+        """Parse a serialized orientation (int, or legacy string name); None if unknown"""
+        if value is None:
+            return None
+        try:
+            if isinstance(value, str):
+                return cls[value.upper()]
+            return cls(value)
+        except (KeyError, ValueError):
+            return None
+
+
+# String form of each Orientation, indexed by value
+_ORIENTATION_LABELS = ('horizontal', 'vertical', 'square')
+
+
+@dataclass(eq=False)
 class Video:
     """
     Represents a single video with its own timeline and segments.
     Part of a multi-video project architecture.
+
+    Identity (equality and hashing) is based solely on the video id.
     """
 
     id: str
     name: str
     path: str
-    timeline: Timeline
+    timeline: 'Timeline'
     order: int
     created_at: datetime = field(default_factory=datetime.now)
 
@@ -36,7 +66,6 @@ class Video:
 
     def __post_init__(self):
         """Initialize video metadata from timeline after creation"""
-        from utils.logger import logger
 
         if self.timeline is not None:
             self.duration = self.timeline.video_duration
@@ -83,7 +112,8 @@ class Video:
         Returns:
             Video instance with initialized timeline
         """
-        from utils.logger import logger
+        # Deferred so metadata-only consumers don't pay for the ffprobe import chain
+        from models.timeline import Timeline
 
         video_id = str(uuid4())
 
@@ -147,7 +177,7 @@ class Video:
             Tuple of (is_compatible: bool, reason: str)
         """
         # Check if orientation matches
-        if self.orientation != other.orientation:
+        if Orientation.parse(self.orientation) != Orientation.parse(other.orientation):
             return (
                 False,
                 f"Incompatible orientations: '{self.orientation}' vs '{other.orientation}'. "
@@ -194,23 +224,44 @@ class Video:
     @classmethod
     def from_dict(cls, data: dict) -> 'Video':
         """Deserialize Video from dictionary"""
+        from models.timeline import Timeline
+
         timeline = Timeline.from_dict(data['timeline'])
 
+        # Integer orientation codes were written briefly; unknown values load as None
+        orientation = Orientation.parse(data.get('orientation'))
+
+        # ISO-8601 on disk (fromisoformat is a C-level parse); integer epoch
+        # microseconds were written briefly and are still accepted
+        created_at = data['created_at']
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        else:
+            created_at = datetime.fromtimestamp(created_at / 1_000_000)
+
         return cls(
             id=data['id'],
             name=data['name'],
             path=data['path'],
             timeline=timeline,
             order=data['order'],
-            created_at=datetime.fromisoformat(data['created_at']),
+            created_at=created_at,
             duration=data.get('duration'),
             width=data.get('width'),
             height=data.get('height'),
             fps=data.get('fps'),
             codec=data.get('codec'),
             aspect_ratio=data.get('aspect_ratio'),
-            orientation=data.get('orientation')
+            orientation=None if orientation is None else _ORIENTATION_LABELS[orientation]
         )
 
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Video):
+            return NotImplemented
+        return self.id == other.id
+
     def __repr__(self) -> str:
         return f"Video(name='{self.name}', path='{self.path}', order={self.order}, segments={len(self.timeline.segments)})"
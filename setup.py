@@ -9,6 +9,8 @@ is the preferred configuration file.
 Author: Santhosh T
 """
 
+import mmap
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -17,12 +19,16 @@ this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text(encoding="utf-8")
 
 # Read requirements from requirements.txt
+# Memory-mapped so large constraints files are parsed straight from the page cache
 requirements = []
-with open("requirements.txt", "r", encoding="utf-8") as f:
-    for line in f:
-        line = line.strip()
-        if line and not line.startswith("#"):
-            requirements.append(line)
+with open("requirements.txt", "rb") as f:
+    # mmap refuses empty files - nothing to parse
+    if os.fstat(f.fileno()).st_size:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                line = line.strip()
+                if line and not line.startswith(b"#"):
+                    requirements.append(line.decode("utf-8"))
 
 setup(
     name="termivoxed",
@@ -75,6 +81,9 @@ setup(
             "pytest-asyncio",
             "pytest-cov",
         ],
+        "tui": [
+            "questionary",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -2,17 +2,224 @@
 Interactive File Picker - Multi-select file browser with arrow key navigation
 """
 
+import heapq
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Tuple
 import inquirer
 from inquirer import themes
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt
+from rich.text import Text
 
-console = Console()
+try:
+    # Optional: prompt_toolkit-based prompts only redraw what changed per keypress
+    import questionary
+except ImportError:
+    questionary = None
+
+# Styling comes from explicit markup; skip the auto-highlight regex pass on every print
+console = Console(highlight=False)
+
+# Static guide shown when the picker opens - built once per process
+_GUIDE_PANEL = Panel.fit(
+    "[bold cyan]Interactive Video File Picker[/bold cyan]\n\n"
+    "[bold]Stage 1:[/bold] Navigate to folder with videos\n"
+    "[bold]Stage 2:[/bold] Multi-select videos with [yellow]Space[/yellow] key\n\n"
+    "• Use [yellow]↑/↓[/yellow] arrow keys to navigate\n"
+    "• Press [yellow]Enter[/yellow] to open directory or select folder\n"
+    "• Use [yellow]🔍 SEARCH[/yellow] to find folders/files by name\n"
+    "• Press [yellow]Ctrl+C[/yellow] to cancel anytime",
+    title="File Picker Guide",
+    border_style="cyan"
+)
+
+# Supported video extensions
+VIDEO_EXTENSIONS = frozenset({
+    '.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.m4v',
+    '.mpeg', '.mpg', '.wmv', '.3gp', '.ogv', '.ts', '.mts'
+})
+
+# Folders that never hold user videos but can hold huge trees; skipped by recursive scans
+SKIP_DIRS = frozenset({
+    'node_modules', '__pycache__', 'venv', 'site-packages',
+    'Library', 'AppData', '$RECYCLE.BIN', 'System Volume Information'
+})
+
+# Tuple form for a single C-level str.endswith() check
+_VIDEO_EXT_TUPLE = tuple(VIDEO_EXTENSIONS)
+_VIDEO_EXT_MAX_LEN = max(map(len, VIDEO_EXTENSIONS))
+
+
+@lru_cache(maxsize=None)
+def _home() -> Path:
+    """User's home directory, resolved once per process"""
+    return Path.home()
+
+
+def _is_video_name(name: str) -> bool:
+    """Check a file name against the supported video extensions"""
+    # Lowercase only the tail that can hold an extension, not the whole name
+    return name[-_VIDEO_EXT_MAX_LEN:].lower().endswith(_VIDEO_EXT_TUPLE)
+
+
+# Opt-in parallel stat()/readdir for high-latency (network/FUSE) filesystems;
+# on local disks the thread pool costs more than it saves
+_PARALLEL_STAT = os.environ.get('TERMIVOXED_PARALLEL_STAT') == '1'
+_PARALLEL_STAT_MIN_FILES = 8
+_PARALLEL_STAT_WORKERS = 16
+_PARALLEL_SEARCH_WORKERS = 8
+
+
+# DirEntry.inode() is free on POSIX (d_ino from readdir) but costs a stat() on Windows
+_INODE_ORDER_STAT = os.name == 'posix'
+
+
+def _entry_size(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat().st_size
+    except OSError:
+        # Vanished file or broken symlink - show it as empty rather than failing
+        return 0
+
+
+def _entry_sizes(entries: list) -> List[int]:
+    """Get file sizes of DirEntry/Path objects, overlapping stat() latency across threads"""
+    if _PARALLEL_STAT and len(entries) > _PARALLEL_STAT_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=_PARALLEL_STAT_WORKERS) as executor:
+            return list(executor.map(_entry_size, entries))
+    return [_entry_size(e) for e in entries]
+
+
+def _scan_search_dir(path: str, depth: int, max_depth: int, needle: str) -> tuple:
+    """
+    Scan one folder for search matches with os.scandir
+
+    Entry types come from readdir (d_type) and matches are kept as DirEntry objects,
+    so no Path is built and a later stat() can reuse the entry's cache.
+
+    Returns:
+        Tuple of (matching_dirs, matching_videos, subdirs) where subdirs are
+        (path, depth) pairs still to be scanned
+    """
+    matching_dirs = []
+    matching_videos = []
+    subdirs = []
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+
+                # Skip hidden and known-heavy folders by name, before any type check
+                if name.startswith('.') or name in SKIP_DIRS:
+                    continue
+
+                try:
+                    is_dir = entry.is_dir()
+
+                    # Check if name matches search term; the folded name is reused
+                    # for the extension test (all extensions are lowercase ASCII)
+                    folded = name.casefold()
+                    if needle in folded:
+                        if is_dir:
+                            matching_dirs.append(entry)
+                        elif folded.endswith(_VIDEO_EXT_TUPLE) and entry.is_file():
+                            matching_videos.append(entry)
+
+                    # Descend into directories, but not through symlinks (like os.walk's
+                    # followlinks=False) so linked trees aren't scanned twice or in a loop
+                    if is_dir and depth < max_depth and not entry.is_symlink():
+                        subdirs.append((entry.path, depth + 1))
+
+                except OSError:
+                    # Skip items we can't access
+                    continue
+
+    except OSError:
+        # Skip directories we can't access
+        pass
+
+    return matching_dirs, matching_videos, subdirs
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a byte count as 'X.Y MB' or 'X.Y GB' using integer arithmetic only"""
+    if size_bytes >= 1 << 30:
+        tenths = (size_bytes * 10 + (1 << 29)) >> 30
+        return f'{tenths // 10}.{tenths % 10} GB'
+    tenths = (size_bytes * 10 + (1 << 19)) >> 20
+    return f'{tenths // 10}.{tenths % 10} MB'
+
+
+class _FoundVideo(NamedTuple):
+    """Video found by a recursive scan; quacks like os.DirEntry for the picker"""
+
+    name: str  # Display name: path relative to the scan root
+    path: str  # Absolute path
+
+    def stat(self) -> os.stat_result:
+        return os.stat(self.path)
+
+
+def _questionary_choices(choices: list) -> list:
+    """Convert inquirer-style (label, value) choices; None values become separators"""
+    return [
+        questionary.Separator(label) if value is None else questionary.Choice(label, value=value)
+        for label, value in choices
+    ]
+
+
+def _prompt_list(name: str, message: str, choices: list) -> Optional[dict]:
+    """
+    Single-choice menu using questionary when installed, inquirer otherwise
+
+    Returns:
+        inquirer-style answer dict ({name: value}) or None if cancelled
+    """
+    if questionary is not None:
+        value = questionary.select(
+            message, choices=_questionary_choices(choices), use_arrow_keys=True
+        ).ask()
+        return None if value is None else {name: value}
+
+    questions = [inquirer.List(name, message=message, choices=choices, carousel=True)]
+    return inquirer.prompt(questions, theme=themes.GreenPassion())
+
+
+def _prompt_checkbox(name: str, message: str, choices: list) -> Optional[dict]:
+    """
+    Multi-choice checkbox using questionary when installed, inquirer otherwise
+
+    Returns:
+        inquirer-style answer dict ({name: [values]}) or None if cancelled
+    """
+    if questionary is not None:
+        values = questionary.checkbox(message, choices=_questionary_choices(choices)).ask()
+        return None if values is None else {name: values}
+
+    questions = [inquirer.Checkbox(name, message=message, choices=choices, carousel=True)]
+    return inquirer.prompt(questions, theme=themes.GreenPassion())
+
+
+def _entry_sort_key(entry) -> str:
+    """Case-insensitive name key for os.DirEntry or Path objects"""
+    return entry.name.lower()
+
+
+def _first_by_name(entries: list, limit: Optional[int]) -> list:
+    """Return at most `limit` entries in case-insensitive name order"""
+    if limit is not None and len(entries) > limit:
+        # Partial selection: O(n log limit) instead of sorting everything
+        return heapq.nsmallest(limit, entries, key=_entry_sort_key)
+    entries.sort(key=_entry_sort_key)
+    return entries
 
 
 class FilePicker:
@@ -21,105 +228,231 @@ class FilePicker:
     Allows browsing filesystem and selecting multiple files using arrow keys.
     """
 
-    # Supported video extensions
-    VIDEO_EXTENSIONS = {
-        '.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.m4v',
-        '.mpeg', '.mpg', '.wmv', '.3gp', '.ogv', '.ts', '.mts'
-    }
+    VIDEO_EXTENSIONS = VIDEO_EXTENSIONS
 
-    def __init__(self, start_path: Optional[str] = None, multi_select: bool = True):
+    # Maximum entries listed per directory (use search to reach the rest)
+    MAX_DIRS = 500
+    MAX_VIDEOS = 1000
+
+    # Maximum search results shown per category
+    MAX_SEARCH_RESULTS = 200
+
+    # Listing/search cache: entry lifetime in seconds and max entries (LRU)
+    LISTING_CACHE_TTL = 30
+    SEARCH_CACHE_TTL = 30
+    CACHE_MAX_ENTRIES = 64
+
+    def __init__(
+        self,
+        start_path: Optional[str] = None,
+        multi_select: bool = True,
+        recursive: bool = False
+    ):
         """
         Initialize FilePicker
 
         Args:
             start_path: Starting directory path (default: user's home directory)
             multi_select: Allow selecting multiple files (default: True)
+            recursive: Start by offering every video under start_path in one list (default: False)
         """
         if start_path:
-            self.current_path = Path(start_path).expanduser().absolute()
+            self.current_path = Path(os.path.abspath(os.path.expanduser(start_path)))
         else:
-            self.current_path = Path.home()
+            self.current_path = _home()
 
         self.multi_select = multi_select
+        self.recursive = recursive
         self.selected_files: List[Path] = []
 
+        # Directory listings keyed by path, validated against the directory's mtime
+        # (file sizes can change without touching it, hence the TTL as well)
+        self._listing_cache: OrderedDict = OrderedDict()
+
+        # Search results keyed by (path, term, depth, limit)
+        self._search_cache: OrderedDict = OrderedDict()
+
+        # Untruncated (directories, videos) counts of the last listing / search
+        self.listing_totals: Tuple[int, int] = (0, 0)
+        self.search_totals: Tuple[int, int] = (0, 0)
+
+        # "Current Directory" header renderables keyed by path string (never stale,
+        # so only bounded by CACHE_MAX_ENTRIES)
+        self._header_cache: OrderedDict = OrderedDict()
+
     def is_video_file(self, path: Path) -> bool:
         """Check if a file is a supported video file"""
-        return path.is_file() and path.suffix.lower() in self.VIDEO_EXTENSIONS
+        return path.is_file() and _is_video_name(path.name)
 
-    def get_directory_contents(self) -> tuple[List[Path], List[Path]]:
+    def get_directory_contents(self) -> tuple[List[os.DirEntry], List[Tuple[os.DirEntry, int]]]:
         """
         Get directories and video files in current path
 
+        Uses os.scandir so the entry type comes from readdir instead of a stat() per entry.
+        Only the first MAX_DIRS directories and MAX_VIDEOS videos (by name) are returned;
+        the untruncated counts are stored in `listing_totals`. Results are cached until
+        the directory's mtime changes.
+
         Returns:
-            Tuple of (directories, video_files)
+            Tuple of (directories, video_files) where video_files are (entry, size_bytes) pairs
         """
         try:
-            items = sorted(self.current_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-
-            directories = [item for item in items if item.is_dir() and not item.name.startswith('.')]
-            video_files = [item for item in items if self.is_video_file(item)]
-
+            mtime_ns = os.stat(self.current_path).st_mtime_ns
+            cached = self._cache_get(self._listing_cache, self.current_path, self.LISTING_CACHE_TTL)
+            if cached and cached[0] == mtime_ns:
+                self.listing_totals = cached[3]
+                return cached[1], cached[2]
+
+            # Single pass: partition while iterating, then sort each bucket
+            directories = []
+            videos = []
+            with os.scandir(self.current_path) as it:
+                for e in it:
+                    if e.is_dir():
+                        if not e.name.startswith('.'):
+                            directories.append(e)
+                    elif e.is_file() and _is_video_name(e.name):
+                        videos.append(e)
+
+            totals = (len(directories), len(videos))
+            directories = _first_by_name(directories, self.MAX_DIRS)
+
+            # Only stat the videos that will actually be shown
+            if len(videos) > self.MAX_VIDEOS:
+                kept = set(map(id, _first_by_name(videos, self.MAX_VIDEOS)))
+                videos = [e for e in videos if id(e) in kept]
+            if _INODE_ORDER_STAT:
+                # stat() in inode order to avoid inode-table seeks on large, cold directories
+                videos.sort(key=os.DirEntry.inode)
+            video_files = list(zip(videos, _entry_sizes(videos)))
+            video_files.sort(key=lambda v: _entry_sort_key(v[0]))
+
+            self._cache_put(self._listing_cache, self.current_path, (mtime_ns, directories, video_files, totals))
+            self.listing_totals = totals
             return directories, video_files
 
         except PermissionError:
             console.print(f"[red]Permission denied: {self.current_path}[/red]")
+            self.listing_totals = (0, 0)
             return [], []
 
-    def search_files_and_folders(self, search_term: str, max_depth: int = 5) -> tuple[List[Path], List[Path]]:
+    def find_videos_recursive(self) -> List[_FoundVideo]:
+        """
+        Find all video files under the current path, skipping hidden folders and SKIP_DIRS
+
+        Returns:
+            List of found videos, named by their path relative to the current path
+        """
+        root = str(self.current_path)
+        found = []
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Prune hidden/heavy folders in place so os.walk never descends into them
+            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, root)
+
+            for filename in filenames:
+                if _is_video_name(filename):
+                    path = os.path.join(dirpath, filename)
+                    # Skip dangling symlinks and other non-regular files (stat only for video names)
+                    if not os.path.isfile(path):
+                        continue
+                    name = filename if rel_dir == '.' else os.path.join(rel_dir, filename)
+                    found.append(_FoundVideo(name, path))
+
+        return found
+
+    def search_files_and_folders(
+        self,
+        search_term: str,
+        max_depth: int = 5,
+        limit: Optional[int] = None
+    ) -> tuple[List[os.DirEntry], List[os.DirEntry]]:
         """
         Recursively search for folders and video files matching the search term
 
         Args:
             search_term: Search string to match against folder/file names (case-insensitive)
             max_depth: Maximum depth to search (default: 5 levels deep)
+            limit: Keep only the first `limit` matches (by name) per category; the
+                untruncated counts are stored in `search_totals` (default: no limit)
 
         Returns:
-            Tuple of (matching_directories, matching_video_files)
+            Tuple of (matching_directories, matching_video_files) as os.DirEntry objects, sorted by name
         """
+        cache_key = (self.current_path, search_term, max_depth, limit)
+        cached = self._cache_get(self._search_cache, cache_key, self.SEARCH_CACHE_TTL)
+        if cached:
+            self.search_totals = cached[2]
+            return cached[0], cached[1]
+
         matching_dirs = []
         matching_videos = []
-        search_lower = search_term.lower()
-
-        def search_recursive(path: Path, current_depth: int):
-            if current_depth > max_depth:
-                return
-
-            try:
-                for item in path.iterdir():
-                    # Skip hidden files/folders
-                    if item.name.startswith('.'):
-                        continue
-
-                    try:
-                        # Check if name matches search term
-                        if search_lower in item.name.lower():
-                            if item.is_dir():
-                                matching_dirs.append(item)
-                            elif self.is_video_file(item):
-                                matching_videos.append(item)
-
-                        # Recurse into directories
-                        if item.is_dir():
-                            search_recursive(item, current_depth + 1)
-
-                    except (PermissionError, OSError):
-                        # Skip items we can't access
-                        continue
-
-            except (PermissionError, OSError):
-                # Skip directories we can't access
-                pass
-
-        # Start search from current path
-        search_recursive(self.current_path, 0)
-
-        # Sort results alphabetically
-        matching_dirs.sort(key=lambda x: x.name.lower())
-        matching_videos.sort(key=lambda x: x.name.lower())
-
+        # Case-folded once here; names are case-folded per entry (faster than re.IGNORECASE)
+        needle = search_term.casefold()
+
+        root = (str(self.current_path), 0)
+
+        if _PARALLEL_STAT:
+            # Overlap readdir latency: each folder is scanned by a worker thread and
+            # its subfolders are submitted back to the pool as they are discovered
+            with ThreadPoolExecutor(max_workers=_PARALLEL_SEARCH_WORKERS) as executor:
+                pending = {executor.submit(_scan_search_dir, *root, max_depth, needle)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        dirs, videos, subdirs = future.result()
+                        matching_dirs.extend(dirs)
+                        matching_videos.extend(videos)
+                        for subdir in subdirs:
+                            pending.add(executor.submit(_scan_search_dir, *subdir, max_depth, needle))
+        else:
+            # Iterative depth-first scan (no recursion / frame overhead)
+            stack = [root]
+            while stack:
+                dirs, videos, subdirs = _scan_search_dir(*stack.pop(), max_depth, needle)
+                matching_dirs.extend(dirs)
+                matching_videos.extend(videos)
+                stack.extend(subdirs)
+
+        # Sort results alphabetically - only the part that will be returned
+        self.search_totals = (len(matching_dirs), len(matching_videos))
+        matching_dirs = _first_by_name(matching_dirs, limit)
+        matching_videos = _first_by_name(matching_videos, limit)
+
+        self._cache_put(self._search_cache, cache_key, (matching_dirs, matching_videos, self.search_totals))
         return matching_dirs, matching_videos
 
+    def _cache_get(self, cache: OrderedDict, key, ttl: float) -> Optional[tuple]:
+        """Get a cached value if it is younger than `ttl` seconds, marking it recently used"""
+        item = cache.get(key)
+        if item is None:
+            return None
+        stored_at, value = item
+        if time.monotonic() - stored_at > ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key, value: tuple):
+        """Store a value, evicting the least recently used entries beyond CACHE_MAX_ENTRIES"""
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > self.CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+    def _result_parents(self, items: List[os.DirEntry]) -> List[str]:
+        """Parent folder of each search result, relative to the current directory when inside it"""
+        base_str = os.path.join(str(self.current_path), '')
+        base_len = len(base_str)
+        parents = []
+        for item in items:
+            s = item.path
+            rel = s[base_len:] if s.startswith(base_str) else s
+            parents.append(rel.rpartition(os.sep)[0] or '.')
+        return parents
+
     def _handle_search(self) -> Optional[List[str]]:
         """
         Handle search functionality - prompt user for search term and display results
@@ -139,7 +472,10 @@ class FilePicker:
 
         console.print(f"\n[cyan]Searching for '{search_term}'...[/cyan]")
 
-        matching_dirs, matching_videos = self.search_files_and_folders(search_term.strip())
+        matching_dirs, matching_videos = self.search_files_and_folders(
+            search_term.strip(), limit=self.MAX_SEARCH_RESULTS
+        )
+        total_dirs, total_videos = self.search_totals
 
         if not matching_dirs and not matching_videos:
             console.print(f"[yellow]No results found for '{search_term}'[/yellow]")
@@ -148,7 +484,7 @@ class FilePicker:
             return None
 
         # Display search results summary
-        console.print(f"\n[green]✓ Found {len(matching_dirs)} folder(s) and {len(matching_videos)} video(s)[/green]\n")
+        console.print(f"\n[green]✓ Found {total_dirs} folder(s) and {total_videos} video(s)[/green]\n")
 
         # Build choices for search results
         choices = []
@@ -159,10 +495,12 @@ class FilePicker:
 
         # Add matching directories
         if matching_dirs:
-            choices.append(('[bold]📁 MATCHING FOLDERS:[/bold]', None))
-            for directory in matching_dirs[:200]:  # Limit to 200 for performance
-                relative_path = directory.relative_to(self.current_path) if directory.is_relative_to(self.current_path) else directory
-                choices.append((f'📁 {directory.name}/ → {relative_path.parent}', ('DIR', str(directory))))
+            choices.append(('📁 MATCHING FOLDERS:', None))
+            # Already limited to MAX_SEARCH_RESULTS
+            choices.extend([
+                (f'📁 {directory.name}/ → {parent}', ('DIR', directory.path))
+                for directory, parent in zip(matching_dirs, self._result_parents(matching_dirs))
+            ])
 
         # Add separator if both types exist
         if matching_dirs and matching_videos:
@@ -170,27 +508,23 @@ class FilePicker:
 
         # Add matching video files
         if matching_videos:
-            choices.append(('[bold]🎬 MATCHING VIDEO FILES:[/bold]', None))
-            for video in matching_videos[:200]:  # Limit to 200 for performance
-                size_mb = video.stat().st_size / (1024 * 1024)
-                relative_path = video.relative_to(self.current_path) if video.is_relative_to(self.current_path) else video
-                choices.append((
-                    f'🎬 {video.name} ({size_mb:.1f} MB) → {relative_path.parent}',
-                    ('VIDEO', str(video))
-                ))
+            choices.append(('🎬 MATCHING VIDEO FILES:', None))
+            # Already limited to MAX_SEARCH_RESULTS; sizes are collected in one batch
+            choices.extend([
+                (
+                    f'🎬 {video.name} ({_format_size(size_bytes)}) → {parent}',
+                    ('VIDEO', video.path)
+                )
+                for video, size_bytes, parent in zip(
+                    matching_videos, _entry_sizes(matching_videos), self._result_parents(matching_videos)
+                )
+            ])
 
         # Show selection menu
-        questions = [
-            inquirer.List(
-                'choice',
-                message='Select a folder to navigate to, or video to select',
-                choices=choices,
-                carousel=True
-            )
-        ]
-
         try:
-            answer = inquirer.prompt(questions, theme=themes.GreenPassion())
+            answer = _prompt_list(
+                'choice', 'Select a folder to navigate to, or video to select', choices
+            )
 
             if not answer or answer['choice'] == 'BACK' or answer['choice'] is None:
                 return None
@@ -214,16 +548,7 @@ class FilePicker:
                     ('Back to search results', 'BACK')
                 ]
 
-                confirm_q = [
-                    inquirer.List(
-                        'action',
-                        message='What would you like to do?',
-                        choices=confirm_choices,
-                        carousel=True
-                    )
-                ]
-
-                confirm_answer = inquirer.prompt(confirm_q, theme=themes.GreenPassion())
+                confirm_answer = _prompt_list('action', 'What would you like to do?', confirm_choices)
 
                 if not confirm_answer or confirm_answer['action'] == 'BACK':
                     return self._handle_search()  # Restart search
@@ -242,14 +567,28 @@ class FilePicker:
 
         return None
 
+    def _directory_header(self) -> Text:
+        """Get the (memoized) "Current Directory" header for the current path"""
+        path_str = str(self.current_path)
+        header = self._cache_get(self._header_cache, path_str, float('inf'))
+        if header is None:
+            # Assembled from styled spans, so no markup parsing is needed
+            header = Text.assemble("\n", ("Current Directory:", "bold"), " ", (path_str, "cyan"))
+            self._cache_put(self._header_cache, path_str, header)
+        return header
+
     def display_current_selection(self):
         """Display currently selected files"""
         if not self.selected_files:
             return
 
-        console.print("\n[cyan]Currently Selected Files:[/cyan]")
+        # Build one grid and print it once instead of one print per file
+        table = Table.grid(padding=(0, 1))
         for idx, file in enumerate(self.selected_files, 1):
-            console.print(f"  [green]{idx}. {file.name}[/green] ({file.parent})")
+            table.add_row(f"  [green]{idx}.[/green]", f"[green]{file.name}[/green]", f"({file.parent})")
+
+        console.print("\n[cyan]Currently Selected Files:[/cyan]")
+        console.print(table)
 
     def pick_files(self) -> List[str]:
         """
@@ -258,27 +597,35 @@ class FilePicker:
         Returns:
             List of selected file paths (absolute paths as strings)
         """
-        console.print(Panel.fit(
-            "[bold cyan]Interactive Video File Picker[/bold cyan]\n\n"
-            "[bold]Stage 1:[/bold] Navigate to folder with videos\n"
-            "[bold]Stage 2:[/bold] Multi-select videos with [yellow]Space[/yellow] key\n\n"
-            "• Use [yellow]↑/↓[/yellow] arrow keys to navigate\n"
-            "• Press [yellow]Enter[/yellow] to open directory or select folder\n"
-            "• Use [yellow]🔍 SEARCH[/yellow] to find folders/files by name\n"
-            "• Press [yellow]Ctrl+C[/yellow] to cancel anytime",
-            title="File Picker Guide",
-            border_style="cyan"
-        ))
+        console.print(_GUIDE_PANEL)
+
+        # Recursive mode: offer every video under the start folder in a flat list
+        if self.recursive:
+            console.print(f"\n[cyan]Scanning {self.current_path} for videos...[/cyan]")
+            found = self.find_videos_recursive()
+            if found:
+                videos = _first_by_name(found, self.MAX_VIDEOS)
+                selected = self._multi_select_videos(list(zip(videos, _entry_sizes(videos))), len(found))
+                if selected:
+                    return selected
+            else:
+                console.print("[yellow]No video files found under this folder[/yellow]")
+            # Nothing picked - fall back to manual navigation
 
         # Stage 1: Navigate to directory
         while True:
             directories, video_files = self.get_directory_contents()
+            total_dirs, total_videos = self.listing_totals
+            cur = self.current_path
+            cur_parent = cur.parent
 
-            console.print(f"\n[bold]Current Directory:[/bold] [cyan]{self.current_path}[/cyan]")
+            console.print(self._directory_header(), soft_wrap=True)
 
             # Show video count in current directory
             if video_files:
-                console.print(f"[bold green]✓ {len(video_files)} video file(s) available here![/bold green]")
+                console.print(f"[bold green]✓ {total_videos} video file(s) available here![/bold green]")
+            if total_dirs > len(directories):
+                console.print(f"[yellow]⚠ Showing first {len(directories)} of {total_dirs} folders. Use search to find specific folders.[/yellow]")
 
             # Build directory navigation choices
             choices = []
@@ -286,7 +633,7 @@ class FilePicker:
             # Add option to select from current directory if videos exist - AT THE TOP
             if video_files:
                 choices.append((
-                    f'❯ ✓ SELECT VIDEOS FROM \'{self.current_path.name}\' FOLDER ({len(video_files)} videos available)',
+                    f'❯ ✓ SELECT VIDEOS FROM \'{cur.name}\' FOLDER ({total_videos} videos available)',
                     'SELECT_HERE'
                 ))
                 choices.append(('─' * 60, None))
@@ -299,25 +646,16 @@ class FilePicker:
             choices.append(('─' * 60, None))
 
             # Add parent directory option if not at root
-            if self.current_path.parent != self.current_path:
+            if cur_parent != cur:
                 choices.append(('📁 .. (Parent Directory)', '..'))
 
-            # Add directories (no limit - show all)
-            for directory in directories:
-                choices.append((f'📁 {directory.name}/', str(directory)))
-
-            # Use inquirer for directory navigation
-            questions = [
-                inquirer.List(
-                    'choice',
-                    message='Navigate to folder (or select to pick videos)',
-                    choices=choices,
-                    carousel=True
-                )
-            ]
+            # Add directories (capped at MAX_DIRS)
+            choices.extend([(f'📁 {directory.name}/', ('DIR', directory.path)) for directory in directories])
 
             try:
-                answer = inquirer.prompt(questions, theme=themes.GreenPassion())
+                answer = _prompt_list(
+                    'choice', 'Navigate to folder (or select to pick videos)', choices
+                )
 
                 if not answer:
                     console.print("\n[yellow]File selection cancelled[/yellow]")
@@ -342,32 +680,37 @@ class FilePicker:
 
                 if choice == 'SELECT_HERE':
                     # Proceed to Stage 2: Multi-select from current directory
-                    selected = self._multi_select_videos(video_files)
+                    selected = self._multi_select_videos(video_files, total_videos)
                     if selected:
                         return selected
                     # If cancelled or no selection, go back to navigation
                     continue
 
                 if choice == '..':
-                    self.current_path = self.current_path.parent
+                    self.current_path = cur_parent
                     continue
 
-                # Navigate into directory
-                selected_path = Path(choice)
-                if selected_path.is_dir():
-                    self.current_path = selected_path
+                # Navigate into directory (scandir already established it is one)
+                choice_type, choice_path = choice
+                if choice_type == 'DIR':
+                    self.current_path = Path(choice_path)
                     continue
 
             except KeyboardInterrupt:
                 console.print("\n\n[yellow]File selection cancelled[/yellow]")
                 return []
 
-    def _multi_select_videos(self, video_files: List[Path]) -> List[str]:
+    def _multi_select_videos(
+        self,
+        video_files: List[Tuple[os.DirEntry, int]],
+        total_videos: Optional[int] = None
+    ) -> List[str]:
         """
         Stage 2: Multi-select videos using Checkbox (Space key works!)
 
         Args:
-            video_files: List of video file paths to select from
+            video_files: List of (video entry, size in bytes) pairs to select from
+            total_videos: Number of videos in the folder before truncation (default: len(video_files))
 
         Returns:
             List of selected file paths
@@ -375,36 +718,30 @@ class FilePicker:
         console.print(f"\n[bold green]Select Videos[/bold green]")
         console.print(f"[dim]Use Space to select/deselect, Enter to confirm[/dim]\n")
 
-        # Show info if many files, but allow all to be displayed
-        if len(video_files) > 100:
-            console.print(f"[cyan]ℹ {len(video_files)} videos found in this folder.[/cyan]")
-            if len(video_files) > 1000:
-                console.print(f"[yellow]⚠ Large number of videos. Showing first 1000. Use search to find specific files.[/yellow]")
-                video_files = video_files[:1000]
+        if total_videos is None:
+            total_videos = len(video_files)
+
+        # Show info if many files; the listing is already capped at MAX_VIDEOS
+        if total_videos > 100:
+            console.print(f"[cyan]ℹ {total_videos} videos found in this folder.[/cyan]")
+            if total_videos > len(video_files):
+                console.print(f"[yellow]⚠ Large number of videos. Showing first {len(video_files)}. Use search to find specific files.[/yellow]")
 
         # Build checkbox choices
-        choices = []
-        for video in video_files:
-            size_mb = video.stat().st_size / (1024 * 1024)
-            display_name = f'{video.name} ({size_mb:.1f} MB)'
-            choices.append((display_name, str(video.absolute())))
+        choices = [
+            (f'{video.name} ({_format_size(size_bytes)})', video.path)
+            for video, size_bytes in video_files
+        ]
 
         if not choices:
             console.print("[yellow]No video files found in this directory[/yellow]")
             return []
 
         # Use Checkbox for multi-select (Space key works here!)
-        questions = [
-            inquirer.Checkbox(
-                'videos',
-                message='Select videos (Space to toggle, Enter to confirm)',
-                choices=choices,
-                carousel=True
-            )
-        ]
-
         try:
-            answer = inquirer.prompt(questions, theme=themes.GreenPassion())
+            answer = _prompt_checkbox(
+                'videos', 'Select videos (Space to toggle, Enter to confirm)', choices
+            )
 
             if not answer or not answer['videos']:
                 console.print("\n[yellow]No videos selected[/yellow]")
@@ -413,9 +750,11 @@ class FilePicker:
             selected_paths = answer['videos']
             console.print(f"\n[green]✓ {len(selected_paths)} video(s) selected[/green]")
 
-            # Show selected files
+            # Show selected files (single grid, single print)
+            table = Table.grid(padding=(0, 1))
             for idx, path in enumerate(selected_paths, 1):
-                console.print(f"  {idx}. {Path(path).name}")
+                table.add_row(f"  {idx}.", os.path.basename(path))
+            console.print(table)
 
             return selected_paths
 
@@ -424,18 +763,23 @@ class FilePicker:
             return []
 
 
-def pick_video_files(start_path: Optional[str] = None, multi_select: bool = True) -> List[str]:
+def pick_video_files(
+    start_path: Optional[str] = None,
+    multi_select: bool = True,
+    recursive: bool = False
+) -> List[str]:
     """
     Convenience function to pick video files
 
     Args:
         start_path: Starting directory path
         multi_select: Allow selecting multiple files
+        recursive: List every video under start_path instead of navigating first
 
     Returns:
         List of selected file paths (absolute paths)
     """
-    picker = FilePicker(start_path=start_path, multi_select=multi_select)
+    picker = FilePicker(start_path=start_path, multi_select=multi_select, recursive=recursive)
     return picker.pick_files()
 
 
@@ -1,17 +1,49 @@
 """Font Manager - Downloads and installs Google Fonts for FFmpeg/ASS rendering"""
 
 import os
-import sys
+import errno
 import shutil
 import platform
-import requests
-import zipfile
 import re
+import json
+import time
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List
+from urllib.parse import quote_plus, urlsplit
+from typing import TYPE_CHECKING, Optional, List, Dict, Tuple, Iterable
 from utils.logger import logger
 from config import settings
 
+if TYPE_CHECKING:
+    # requests is imported lazily: most runs never download a font
+    import requests
+
+# Characters dropped from font names when building cache directory/file names
+_SAFE_NAME_RE = re.compile(r'[^\w\s-]')
+
+# Font file URLs in a Google Fonts CSS response
+_CSS_URL_RE = re.compile(r'url\((https://[^)]+)\)')
+
+# Font file extension by response media type, for URLs without a font suffix
+_EXT_FROM_CONTENT_TYPE = {
+    'font/ttf': '.ttf',
+    'font/otf': '.otf',
+    'font/woff': '.woff',
+    'font/woff2': '.woff2',
+    'font/collection': '.ttc',
+    'application/x-font-ttf': '.ttf',
+    'application/x-font-truetype': '.ttf',
+    'application/x-font-opentype': '.otf',
+    'application/font-woff': '.woff',
+    'application/font-woff2': '.woff2',
+}
+
+# Style/axis part of a font file stem: "-BoldItalic", "[wght]" or our own "_<index>"
+_FONT_STYLE_SUFFIX_RE = re.compile(r'(?:-.*|\[.*\]|_\d+)$')
+
 
 class FontManager:
     """Manages downloading and installing fonts from Google Fonts"""
@@ -19,14 +51,185 @@ class FontManager:
     # Google Fonts CSS API for getting font URLs
     GOOGLE_FONTS_CSS_API = "https://fonts.googleapis.com/css2?family="
 
-    # Cache of installed fonts to avoid re-downloading
-    _installed_fonts = set()
+    # Font formats FFmpeg/libass can render; other formats in the CSS are skipped when these exist
+    RENDERABLE_FONT_EXTENSIONS = ('.ttf', '.otf')
+
+    # Per-font file (in the font's cache directory) holding the last CSS response's
+    # ETag/Last-Modified and font URLs, for conditional re-fetches
+    CSS_META_FILE = ".css_meta.json"
+
+    # Use a desktop User-Agent to get TTF files instead of WOFF2
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+    # Cache of installed fonts to avoid re-downloading: font name -> {path, mtime, installed_at}
+    # Persisted to INSTALLED_CACHE_FILE so later runs skip the font directory scan
+    INSTALLED_CACHE_FILE = "installed.json"
+    _installed_fonts: Dict[str, dict] = {}
+    _installed_fonts_loaded = False
+    _installed_fonts_lock = threading.Lock()
+
+    # Fonts Google Fonts doesn't serve: font name -> time of failure. Persisted to
+    # FAILED_CACHE_FILE so a bad name isn't looked up again until FAILED_FONT_TTL expires.
+    # Only definitive misses (400/404, or no font files in the CSS) are recorded; network
+    # errors, 5xx and other 4xx responses (403, 408, 429, ...) are retried on the next call
+    FAILED_CACHE_FILE = "failed.json"
+    FAILED_FONT_TTL = 24 * 60 * 60  # 24 hours
+    _failed_fonts: Optional[Dict[str, float]] = None
+    _failed_fonts_lock = threading.Lock()
+
+    # System default fonts that never need installing (lowercase; compared case-insensitively)
+    DEFAULT_FONTS = frozenset({'arial', 'roboto', 'times new roman', 'helvetica', 'dejavu sans'})
+
+    # Font file extensions recognized in the system font directory
+    FONT_EXTENSIONS = frozenset({'.ttf', '.otf', '.ttc', '.woff', '.woff2'})
+
+    # (normalized stem -> font file, normalized family -> font file) for the system font
+    # directory, built on first lookup and reset whenever fonts are installed
+    _system_font_index: Optional[Tuple[Dict[str, Path], Dict[str, Path]]] = None
+
+    # While batch_install() is active, fc-cache runs once when the outermost batch ends
+    _cache_update_batch_depth = 0
+    _cache_update_pending = False
+
+    # Shared HTTP session so the CSS and font file requests reuse pooled keep-alive connections
+    _session: Optional['requests.Session'] = None
+    _session_lock = threading.Lock()
+
+    @staticmethod
+    def _get_session() -> 'requests.Session':
+        """Get the shared HTTP session, creating it on first use"""
+        if FontManager._session is None:
+            with FontManager._session_lock:
+                if FontManager._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+
+                    session = requests.Session()
+                    session.headers['User-Agent'] = FontManager.USER_AGENT
+                    # Retry connection errors and 429/5xx up to 3 times with exponential
+                    # backoff (backoff_factor 0.3), honoring Retry-After on 429/503
+                    retries = Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504]
+                    )
+                    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+                    FontManager._session = session
+        return FontManager._session
+
+    @staticmethod
+    def _installed_cache_path() -> Path:
+        """Path of the persisted installed-font cache"""
+        return Path(settings.FONTS_DIR) / FontManager.INSTALLED_CACHE_FILE
+
+    @staticmethod
+    def _load_installed_fonts():
+        """Load the persisted installed-font cache, dropping entries whose font file changed or vanished"""
+        # Loaded under the lock and flagged only once filled, so concurrent callers
+        # never see a partial cache
+        with FontManager._installed_fonts_lock:
+            if FontManager._installed_fonts_loaded:
+                return
+            try:
+                with open(FontManager._installed_cache_path(), 'r') as f:
+                    entries = json.load(f)
+            except FileNotFoundError:
+                entries = {}
+            except Exception as e:
+                logger.warning(f"Could not load installed fonts cache: {e}")
+                entries = {}
+
+            for font_name, entry in entries.items():
+                try:
+                    if os.stat(entry['path']).st_mtime == entry['mtime']:
+                        FontManager._installed_fonts[font_name] = entry
+                except (OSError, KeyError, TypeError):
+                    continue
+
+            FontManager._installed_fonts_loaded = True
+
+    @staticmethod
+    def _remember_installed_font(font_name: str, font_file: Path):
+        """Record an installed font and save the cache to disk (atomically)"""
+        try:
+            with FontManager._installed_fonts_lock:
+                FontManager._installed_fonts[font_name] = {
+                    'path': str(font_file),
+                    'mtime': font_file.stat().st_mtime,
+                    'installed_at': time.time()
+                }
+                FontManager._write_json_cache(FontManager._installed_cache_path(), FontManager._installed_fonts)
+        except Exception as e:
+            logger.warning(f"Could not save installed fonts cache: {e}")
+
+    @staticmethod
+    def _write_json_cache(cache_path: Path, data: dict):
+        """Write a JSON cache file atomically (temp file + rename)"""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_path.with_name(cache_path.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_path)
+
+    @staticmethod
+    def _load_css_meta(css_meta_path: Path, css_url: str) -> Optional[dict]:
+        """Load validators and font URLs saved from an earlier fetch of `css_url`, if any"""
+        try:
+            with open(css_meta_path, 'r') as f:
+                css_meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if css_meta.get('css_url') != css_url or not css_meta.get('font_urls'):
+            return None
+        return css_meta
+
+    @staticmethod
+    def _get_failed_fonts() -> Dict[str, float]:
+        """Get the recent install failures, loading them from disk on first use"""
+        if FontManager._failed_fonts is None:
+            failed = {}
+            try:
+                with open(Path(settings.FONTS_DIR) / FontManager.FAILED_CACHE_FILE, 'r') as f:
+                    failed = json.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not load failed fonts cache: {e}")
+            FontManager._failed_fonts = failed
+        return FontManager._failed_fonts
+
+    @staticmethod
+    def _is_recently_failed(font_name: str) -> bool:
+        """Check whether installing a font failed less than FAILED_FONT_TTL ago"""
+        failed_at = FontManager._get_failed_fonts().get(font_name)
+        return failed_at is not None and time.time() - failed_at < FontManager.FAILED_FONT_TTL
 
     @staticmethod
+    def _set_failed_font(font_name: str, failed: bool):
+        """Record (or clear) an install failure and save the failed fonts cache"""
+        with FontManager._failed_fonts_lock:
+            failed_fonts = FontManager._get_failed_fonts()
+            if failed:
+                failed_fonts[font_name] = time.time()
+            elif failed_fonts.pop(font_name, None) is None:
+                return
+
+            # Drop expired entries while rewriting the file
+            now = time.time()
+            for name in [n for n, t in failed_fonts.items() if now - t >= FontManager.FAILED_FONT_TTL]:
+                del failed_fonts[name]
+            try:
+                FontManager._write_json_cache(Path(settings.FONTS_DIR) / FontManager.FAILED_CACHE_FILE, failed_fonts)
+            except Exception as e:
+                logger.warning(f"Could not save failed fonts cache: {e}")
+
+    @staticmethod
+    @lru_cache(maxsize=1)
     def get_system_font_dir() -> Optional[Path]:
         """
         Get the appropriate system font directory based on platform
-        Returns user font directory (no sudo/admin required)
+        Returns user font directory (no sudo/admin required); computed once per process
         """
         system = platform.system()
 
@@ -45,9 +248,43 @@ class FontManager:
             return None
 
         # Create directory if it doesn't exist
-        font_dir.mkdir(parents=True, exist_ok=True)
+        if not font_dir.exists():
+            font_dir.mkdir(parents=True, exist_ok=True)
         return font_dir
 
+    @staticmethod
+    def _list_font_files(directory: Path) -> List[Path]:
+        """List font files (by FONT_EXTENSIONS) in a directory with a single scandir pass"""
+        try:
+            with os.scandir(directory) as it:
+                return [
+                    Path(entry.path) for entry in it
+                    if os.path.splitext(entry.name)[1].lower() in FontManager.FONT_EXTENSIONS
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _get_system_font_index(system_font_dir: Path) -> Tuple[Dict[str, Path], Dict[str, Path]]:
+        """
+        Get the indexes of the system font directory, scanning it once
+
+        Returns:
+            Tuple of (normalized stem -> font file, normalized family name -> font file)
+        """
+        index = FontManager._system_font_index
+        if index is None:
+            stems = {}
+            families = {}
+            for font_file in FontManager._list_font_files(system_font_dir):
+                stem = font_file.stem
+                stems.setdefault(stem.replace(" ", "").replace("-", "").lower(), font_file)
+                family = _FONT_STYLE_SUFFIX_RE.sub('', stem).replace(" ", "").replace("_", "").lower()
+                families.setdefault(family, font_file)
+            index = FontManager._system_font_index = (stems, families)
+        return index
+
     @staticmethod
     def is_font_installed(font_name: str) -> bool:
         """
@@ -60,6 +297,8 @@ class FontManager:
             True if font is installed, False otherwise
         """
         # Check cache first
+        if not FontManager._installed_fonts_loaded:
+            FontManager._load_installed_fonts()
         if font_name in FontManager._installed_fonts:
             return True
 
@@ -70,14 +309,19 @@ class FontManager:
         # Normalize font name for file matching
         normalized_name = font_name.replace(" ", "").lower()
 
-        # Check if any font files with this name exist
-        for font_file in system_font_dir.glob("*"):
-            if font_file.suffix.lower() in ['.ttf', '.otf', '.ttc', '.woff', '.woff2']:
-                file_normalized = font_file.stem.replace(" ", "").replace("-", "").lower()
-                if normalized_name in file_normalized:
-                    FontManager._installed_fonts.add(font_name)
-                    logger.info(f"Font '{font_name}' found: {font_file.name}")
-                    return True
+        # Exact family match first, then any font file whose name contains the font name
+        stems, families = FontManager._get_system_font_index(system_font_dir)
+        font_file = families.get(normalized_name)
+        if font_file is None:
+            font_file = next(
+                (path for file_normalized, path in stems.items() if normalized_name in file_normalized),
+                None
+            )
+
+        if font_file is not None:
+            FontManager._remember_installed_font(font_name, font_file)
+            logger.info(f"Font '{font_name}' found: {font_file.name}")
+            return True
 
         return False
 
@@ -92,91 +336,93 @@ class FontManager:
         Returns:
             Path to downloaded font directory, or None if download failed
         """
+        import requests
+
         try:
             # Create fonts cache directory
             fonts_dir = Path(settings.FONTS_DIR)
             fonts_dir.mkdir(parents=True, exist_ok=True)
 
             # Normalize font name for directory
-            safe_font_name = re.sub(r'[^\w\s-]', '', font_name).replace(' ', '_')
+            safe_font_name = _SAFE_NAME_RE.sub('', font_name).replace(' ', '_')
             font_cache_dir = fonts_dir / safe_font_name
 
             # Check if already downloaded (any font format)
-            if font_cache_dir.exists():
-                existing_fonts = (list(font_cache_dir.glob("*.ttf")) +
-                                  list(font_cache_dir.glob("*.otf")) +
-                                  list(font_cache_dir.glob("*.woff")) +
-                                  list(font_cache_dir.glob("*.woff2")))
-                if existing_fonts:
-                    logger.info(f"Font '{font_name}' already in cache: {font_cache_dir}")
-                    return font_cache_dir
+            if FontManager._list_font_files(font_cache_dir):
+                logger.info(f"Font '{font_name}' already in cache: {font_cache_dir}")
+                return font_cache_dir
 
             # Download font from Google Fonts using CSS API
             logger.info(f"Downloading font '{font_name}' from Google Fonts...")
 
-            # Format font name for URL (replace spaces with +)
-            url_font_name = font_name.replace(' ', '+')
-            css_url = f"{FontManager.GOOGLE_FONTS_CSS_API}{url_font_name}"
+            # Format font name for URL (spaces become +, other characters are percent-encoded)
+            css_url = f"{FontManager.GOOGLE_FONTS_CSS_API}{quote_plus(font_name)}&display=swap"
 
-            # Get CSS file which contains font URLs
-            # Use a desktop User-Agent to get TTF files instead of WOFF2
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(css_url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            css_content = response.text
-
-            # Extract font URLs from CSS
-            # Look for url() patterns
-            font_urls = re.findall(r'url\((https://[^)]+)\)', css_content)
-
-            if not font_urls:
-                logger.error(f"No font URLs found in CSS for '{font_name}'")
-                logger.debug(f"CSS content: {css_content[:500]}")
-                return None
+            # Revalidate a previously fetched CSS instead of downloading it again
+            css_meta_path = font_cache_dir / FontManager.CSS_META_FILE
+            css_meta = FontManager._load_css_meta(css_meta_path, css_url)
+            headers = {}
+            if css_meta:
+                if css_meta.get('etag'):
+                    headers['If-None-Match'] = css_meta['etag']
+                if css_meta.get('last_modified'):
+                    headers['If-Modified-Since'] = css_meta['last_modified']
 
-            logger.info(f"Found {len(font_urls)} font file(s) in CSS")
+            # Get CSS file which contains font URLs
+            session = FontManager._get_session()
+            response = session.get(css_url, headers=headers, timeout=30)
+
+            if response.status_code == 304 and css_meta:
+                font_urls = css_meta['font_urls']
+                logger.info(f"CSS not modified; reusing {len(font_urls)} cached font URL(s)")
+            else:
+                if response.status_code in (400, 404):
+                    # Unknown family (Google Fonts answers 400) - retrying won't help
+                    FontManager._set_failed_font(font_name, True)
+                response.raise_for_status()
+
+                css_content = response.text
+
+                # Extract font URLs from CSS
+                # Look for url() patterns
+                font_urls = _CSS_URL_RE.findall(css_content)
+
+                if not font_urls:
+                    logger.error(f"No font URLs found in CSS for '{font_name}'")
+                    logger.debug(f"CSS content: {css_content[:500]}")
+                    FontManager._set_failed_font(font_name, True)
+                    return None
+
+                # Only fetch formats FFmpeg will use, if the CSS offers any
+                renderable_urls = [url for url in font_urls if url.endswith(FontManager.RENDERABLE_FONT_EXTENSIONS)]
+                if renderable_urls:
+                    font_urls = renderable_urls
+
+                logger.info(f"Found {len(font_urls)} font file(s) in CSS")
+
+                css_meta = {
+                    'css_url': css_url,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'font_urls': font_urls
+                }
+                try:
+                    FontManager._write_json_cache(css_meta_path, css_meta)
+                except Exception as e:
+                    logger.debug(f"Could not save CSS metadata for '{font_name}': {e}")
 
             # Create font cache directory
             font_cache_dir.mkdir(parents=True, exist_ok=True)
 
-            # Download each font file
-            downloaded_count = 0
-            for i, font_url in enumerate(font_urls):
-                try:
-                    # Download font file
-                    font_response = requests.get(font_url, timeout=30)
-                    font_response.raise_for_status()
-
-                    # Determine file extension from content-type or URL
-                    content_type = font_response.headers.get('content-type', '')
-                    if 'woff2' in content_type or font_url.endswith('.woff2'):
-                        ext = '.woff2'
-                    elif 'woff' in content_type or font_url.endswith('.woff'):
-                        ext = '.woff'
-                    elif 'truetype' in content_type or font_url.endswith('.ttf'):
-                        ext = '.ttf'
-                    elif 'opentype' in content_type or font_url.endswith('.otf'):
-                        ext = '.otf'
-                    else:
-                        # Default to ttf
-                        ext = '.ttf'
-
-                    # Save font file
-                    font_file_name = f"{safe_font_name}_{i}{ext}"
-                    font_file_path = font_cache_dir / font_file_name
-
-                    with open(font_file_path, 'wb') as f:
-                        f.write(font_response.content)
-
-                    downloaded_count += 1
-                    logger.info(f"Downloaded: {font_file_name}")
-
-                except Exception as e:
-                    logger.warning(f"Failed to download font file from {font_url}: {e}")
-                    continue
+            # Download font files concurrently over the shared session
+            with ThreadPoolExecutor(max_workers=min(8, len(font_urls))) as executor:
+                futures = [
+                    executor.submit(
+                        FontManager._download_font_file, session, font_url, i, safe_font_name, font_cache_dir
+                    )
+                    for i, font_url in enumerate(font_urls)
+                ]
+                downloaded_count = sum(1 for future in as_completed(futures) if future.result())
 
             if downloaded_count == 0:
                 logger.error(f"Failed to download any font files for '{font_name}'")
@@ -192,6 +438,57 @@ class FontManager:
             logger.error(f"Error downloading font '{font_name}': {e}")
             return None
 
+    @staticmethod
+    def _download_font_file(
+        session: 'requests.Session',
+        font_url: str,
+        index: int,
+        safe_font_name: str,
+        font_cache_dir: Path
+    ) -> Optional[Path]:
+        """
+        Download one font file into the font cache directory
+
+        Returns:
+            Path to the saved font file, or None if the download failed
+        """
+        tmp_path = None
+        try:
+            # Stream the font file to disk instead of holding it in memory
+            with session.get(font_url, stream=True, timeout=30) as font_response:
+                font_response.raise_for_status()
+
+                # Determine file extension from the URL, falling back to content-type
+                # (headers arrive before the body), then to ttf
+                ext = os.path.splitext(urlsplit(font_url).path)[1].lower()
+                if ext not in FontManager.FONT_EXTENSIONS:
+                    media_type = font_response.headers.get('content-type', '').split(';', 1)[0].strip().lower()
+                    ext = _EXT_FROM_CONTENT_TYPE.get(media_type, '.ttf')
+
+                # Save font file
+                font_file_name = f"{safe_font_name}_{index}{ext}"
+                font_file_path = font_cache_dir / font_file_name
+
+                # Written to a temporary file and moved into place once complete, so an
+                # interrupted download never leaves a truncated font in the cache
+                tmp_path = font_file_path.with_name(font_file_name + '.part')
+                with open(tmp_path, 'wb') as f:
+                    for chunk in font_response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                os.replace(tmp_path, font_file_path)
+
+            logger.info(f"Downloaded: {font_file_name}")
+            return font_file_path
+
+        except Exception as e:
+            logger.warning(f"Failed to download font file from {font_url}: {e}")
+            if tmp_path is not None:
+                try:
+                    tmp_path.unlink()
+                except FileNotFoundError:
+                    pass
+            return None
+
     @staticmethod
     def install_font(font_name: str) -> bool:
         """
@@ -222,10 +519,7 @@ class FontManager:
                 return False
 
             # Copy font files to system directory (all formats)
-            font_files = (list(font_cache_dir.glob("*.ttf")) +
-                          list(font_cache_dir.glob("*.otf")) +
-                          list(font_cache_dir.glob("*.woff")) +
-                          list(font_cache_dir.glob("*.woff2")))
+            font_files = FontManager._list_font_files(font_cache_dir)
 
             if not font_files:
                 logger.error(f"No font files found for: {font_name}")
@@ -233,6 +527,7 @@ class FontManager:
 
             logger.info(f"Installing {len(font_files)} font file(s) to: {system_font_dir}")
 
+            installed_count = 0
             for font_file in font_files:
                 dest_path = system_font_dir / font_file.name
 
@@ -241,15 +536,24 @@ class FontManager:
                     logger.info(f"Font file already exists: {font_file.name}")
                     continue
 
-                # Copy font file
-                shutil.copy2(font_file, dest_path)
+                # Link (or copy) font file
+                FontManager._install_font_file(font_file, dest_path)
+                installed_count += 1
                 logger.info(f"Installed: {font_file.name}")
 
-            # Update font cache on system (platform-specific)
-            FontManager._update_font_cache()
+            # Only refresh caches if the system font directory actually changed
+            if installed_count:
+                # Rescan the directory on the next lookup
+                FontManager._system_font_index = None
+
+                # Update font cache on system (platform-specific), deferred while batching
+                if FontManager._cache_update_batch_depth:
+                    FontManager._cache_update_pending = True
+                else:
+                    FontManager._update_font_cache()
 
             # Mark as installed
-            FontManager._installed_fonts.add(font_name)
+            FontManager._remember_installed_font(font_name, system_font_dir / font_files[0].name)
 
             logger.info(f"✓ Font '{font_name}' successfully installed!")
             return True
@@ -258,6 +562,48 @@ class FontManager:
             logger.error(f"Failed to install font '{font_name}': {e}")
             return False
 
+    @staticmethod
+    @contextmanager
+    def batch_install():
+        """
+        Defer system font cache updates while installing several fonts
+
+        Usage:
+            with FontManager.batch_install():
+                for font_name in font_names:
+                    FontManager.ensure_font_available(font_name)
+        """
+        FontManager._cache_update_batch_depth += 1
+        try:
+            yield
+        finally:
+            FontManager._cache_update_batch_depth -= 1
+            if FontManager._cache_update_batch_depth == 0 and FontManager._cache_update_pending:
+                FontManager._cache_update_pending = False
+                FontManager._update_font_cache()
+
+    @staticmethod
+    def _install_font_file(src: Path, dest: Path):
+        """
+        Place a cached font file in the system font directory without copying bytes when possible
+
+        Hard links when both directories share a filesystem, symlinks across filesystems,
+        and copies the contents (without metadata) on Windows or when linking is not possible.
+        """
+        if os.name != 'nt':
+            try:
+                os.link(src, dest)
+                return
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    try:
+                        os.symlink(os.path.abspath(src), dest)
+                        return
+                    except OSError:
+                        pass
+
+        shutil.copyfile(src, dest)
+
     @staticmethod
     def _update_font_cache():
         """
@@ -265,15 +611,22 @@ class FontManager:
         Platform-specific commands
         """
         system = platform.system()
+        FontManager._system_font_index = None
 
         try:
             if system == "Linux":
                 # Run fc-cache to update fontconfig cache
                 import subprocess
-                result = subprocess.run(['fc-cache', '-f', '-v'],
-                                        capture_output=True,
-                                        text=True,
-                                        timeout=30)
+                # No -f: fontconfig rescans only directories whose mtime changed.
+                # Only the return code is used, so the output is discarded, not buffered
+                try:
+                    result = subprocess.run(['fc-cache'],
+                                            stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.DEVNULL,
+                                            timeout=30)
+                except FileNotFoundError:
+                    logger.debug("fc-cache not found; skipping font cache update")
+                    return
                 if result.returncode == 0:
                     logger.info("Font cache updated (fc-cache)")
                 else:
@@ -292,20 +645,20 @@ class FontManager:
             logger.info("Fonts should still work after restart")
 
     @staticmethod
-    def ensure_font_available(font_name: str) -> bool:
+    def ensure_font_available(font_name: str, force: bool = False) -> bool:
         """
         Ensure a font is available for FFmpeg/ASS rendering
         Downloads and installs if necessary
 
         Args:
             font_name: Font family name
+            force: Try to install even if the font recently failed
 
         Returns:
             True if font is available, False otherwise
         """
         # Skip system default fonts
-        default_fonts = ['Arial', 'Roboto', 'Times New Roman', 'Helvetica', 'DejaVu Sans']
-        if font_name in default_fonts:
+        if font_name.strip().lower() in FontManager.DEFAULT_FONTS:
             logger.info(f"Using system default font: {font_name}")
             return True
 
@@ -313,15 +666,56 @@ class FontManager:
         if FontManager.is_font_installed(font_name):
             return True
 
+        # Don't hit Google Fonts again for a font that just failed
+        if not force and FontManager._is_recently_failed(font_name):
+            logger.warning(f"Font '{font_name}' failed to install recently. Video will use system default font.")
+            return False
+
         # Try to install
         logger.info(f"Font '{font_name}' not found. Attempting to download and install...")
         success = FontManager.install_font(font_name)
 
-        if not success:
+        if success:
+            FontManager._set_failed_font(font_name, False)
+        else:
             logger.warning(f"Could not install font '{font_name}'. Video will use system default font.")
 
         return success
 
+    @staticmethod
+    def ensure_fonts_available(font_names: Iterable[str], force: bool = False) -> Dict[str, bool]:
+        """
+        Ensure several fonts are available, installing missing ones concurrently
+        with a single font cache update at the end
+
+        Args:
+            font_names: Font family names (duplicates are checked once)
+            force: Try to install fonts even if they recently failed
+
+        Returns:
+            Dict of font name -> True if the font is available
+        """
+        font_names = list(dict.fromkeys(font_names))
+        if not font_names:
+            return {}
+
+        results = {}
+        with FontManager.batch_install():
+            with ThreadPoolExecutor(max_workers=min(8, len(font_names))) as executor:
+                futures = {
+                    executor.submit(FontManager.ensure_font_available, font_name, force): font_name
+                    for font_name in font_names
+                }
+                for future in as_completed(futures):
+                    font_name = futures[future]
+                    try:
+                        results[font_name] = future.result()
+                    except Exception as e:
+                        logger.warning(f"Could not ensure font '{font_name}' is available: {e}")
+                        results[font_name] = False
+
+        return results
+
     @staticmethod
     def get_available_fonts() -> List[str]:
         """
@@ -330,8 +724,8 @@ class FontManager:
         Returns:
             List of font directory names
         """
-        fonts_dir = Path(settings.FONTS_DIR)
-        if not fonts_dir.exists():
+        try:
+            with os.scandir(settings.FONTS_DIR) as it:
+                return [entry.name for entry in it if entry.is_dir()]
+        except FileNotFoundError:
             return []
-
-        return [d.name for d in fonts_dir.iterdir() if d.is_dir()]
@@ -1,10 +1,22 @@
 """Google Fonts utility for extracting font names from Google Fonts links"""
 
 import re
+import urllib.parse
+from functools import lru_cache
 from typing import Optional
 from utils.logger import logger
 
+# URL inside an HTML <link href="..."> tag
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']')
 
+# Font family names in a Google Fonts URL query
+_FAMILY_RE = re.compile(r'family=([^:&]+)')
+
+# Letters, numbers, spaces and hyphens only
+_VALID_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-]+$')
+
+
+@lru_cache(maxsize=256)
 def parse_google_font_url(url: str) -> Optional[str]:
     """
     Extract font family name from Google Fonts URL
@@ -29,12 +41,12 @@ def parse_google_font_url(url: str) -> Optional[str]:
     # Handle both direct URL and HTML link tag
     if 'href=' in url:
         # Extract URL from HTML link tag
-        match = re.search(r'href=["\']([^"\']+)["\']', url)
+        match = _HREF_RE.search(url)
         if match:
             url = match.group(1)
 
     # Extract ALL family parameters from URL
-    matches = re.findall(r'family=([^:&]+)', url)
+    matches = _FAMILY_RE.findall(url)
 
     if not matches:
         return None
@@ -46,12 +58,12 @@ def parse_google_font_url(url: str) -> Optional[str]:
     font_name = font_name.replace('+', ' ')
 
     # Remove any URL encoding
-    import urllib.parse
     font_name = urllib.parse.unquote(font_name)
 
     return font_name.strip()
 
 
+@lru_cache(maxsize=256)
 def validate_font_name(font_name: str) -> bool:
     """
     Validate that font name is reasonable for FFmpeg/ASS
@@ -66,12 +78,13 @@ def validate_font_name(font_name: str) -> bool:
         return False
 
     # Font name should only contain letters, numbers, spaces, hyphens
-    if not re.match(r'^[a-zA-Z0-9\s\-]+$', font_name):
+    if not _VALID_NAME_RE.match(font_name):
         return False
 
     return True
 
 
+@lru_cache(maxsize=256)
 def get_font_from_input(user_input: str, default_font: str = "Arial") -> str:
     """
     Get font name from user input (URL or direct name)
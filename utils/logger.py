@@ -8,12 +8,16 @@ from pathlib import Path
 # Remove default handler
 logger.remove()
 
+# Console output is muted (not removed) while suppress_console_logs() is active
+_console_muted = False
+
 # Add console handler with custom format
 console_handler_id = logger.add(
     sys.stderr,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
     level="INFO",
-    colorize=True
+    colorize=True,
+    filter=lambda record: not _console_muted
 )
 
 # Add file handler
@@ -43,21 +47,17 @@ def suppress_console_logs():
             # Your code with progress bars
             pass
     """
-    global console_handler_id
+    global _console_muted
 
-    # Remove console handler
-    logger.remove(console_handler_id)
+    # Mute console handler (nested uses restore the outer state)
+    previous = _console_muted
+    _console_muted = True
 
     try:
         yield
     finally:
         # Restore console handler
-        console_handler_id = logger.add(
-            sys.stderr,
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-            level="INFO",
-            colorize=True
-        )
+        _console_muted = previous
 
 
 __all__ = ["logger", "suppress_console_logs"]
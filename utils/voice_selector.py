@@ -1,22 +1,54 @@
 """Interactive Voice Selector with Preview - Enhanced UX for voice selection"""
 
 import asyncio
+import functools
+import hashlib
+import io
 import os
 import tempfile
+import time
 from pathlib import Path
-from typing import List, Dict, Optional
-import inquirer
-from inquirer import themes
-import pygame
+from typing import BinaryIO, List, Dict, Optional, Union
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
-from utils.logger import logger
+from utils.logger import logger, suppress_console_logs
 
 console = Console()
 
+# edge-tts previews are 24 kHz MP3, so mixing at 24 kHz avoids resampling on every play.
+# A 4096-sample buffer avoids underruns under load; override with TERMIVOXED_AUDIO_BUFFER.
+_MIXER_FREQUENCY = 24000
+try:
+    _MIXER_BUFFER = int(os.environ.get('TERMIVOXED_AUDIO_BUFFER', 4096))
+except ValueError:
+    _MIXER_BUFFER = 4096
+
+
+# Voice preview sentence per language code
+_PREVIEW_TEXTS = {
+    'en': "Hello! This is a voice preview. How do you like this voice?",
+    'hi': "नमस्ते! यह एक आवाज़ का पूर्वावलोकन है। आपको यह आवाज़ कैसी लगी?",
+    'ta': "வணக்கம்! இது குரல் முன்னோட்டம். இந்த குரல் உங்களுக்கு எப்படி உள்ளது?",
+    'te': "నమస్కారం! ఇది వాయిస్ ప్రివ్యూ. ఈ వాయిస్ మీకు ఎలా అనిపిస్తుంది?",
+    'kn': "ನಮಸ್ಕಾರ! ಇದು ಧ್ವನಿ ಪೂರ್ವವೀಕ್ಷಣೆ. ಈ ಧ್ವನಿ ನಿಮಗೆ ಹೇಗೆ ಅನಿಸುತ್ತದೆ?",
+    'ml': "നമസ്കാരം! ഇതൊരു ശബ്ദ പ്രിവ്യൂ ആണ്. ഈ ശബ്ദം നിങ്ങൾക്ക് എങ്ങനെയുണ്ട്?",
+    'fr': "Bonjour! Ceci est un aperçu vocal. Comment aimez-vous cette voix?",
+    'es': "¡Hola! Esta es una vista previa de voz. ¿Cómo te gusta esta voz?",
+    'de': "Hallo! Dies ist eine Sprachvorschau. Wie gefällt Ihnen diese Stimme?",
+    'ko': "안녕하세요! 이것은 음성 미리보기입니다. 이 목소리가 어떻습니까?",
+    'ja': "こんにちは！これは音声プレビューです。この声はいかがですか？",
+    'zh': "你好！这是语音预览。你觉得这个声音怎么样？",
+    'ar': "مرحبا! هذه معاينة صوتية. كيف تحب هذا الصوت؟",
+    'ru': "Привет! Это предварительный просмотр голоса. Как вам этот голос?",
+    'pt': "Olá! Esta é uma prévia de voz. Como você gosta dessa voz?",
+    'it': "Ciao! Questa è un'anteprima vocale. Come ti piace questa voce?"
+}
+
+_DEFAULT_PREVIEW_TEXT = _PREVIEW_TEXTS['en']
+
 
 class VoiceSelector:
     """
@@ -24,6 +56,17 @@ class VoiceSelector:
     Provides arrow-key navigation and audio preview for voice selection
     """
 
+    # Previews for the first voices in the list are generated in the background
+    # while the user browses (at most PREWARM_CONCURRENCY requests at a time)
+    PREWARM_MAX_VOICES = 20
+    PREWARM_CONCURRENCY = 8
+
+    # Preview files smaller than this are treated as failed/corrupt generations
+    MIN_PREVIEW_SIZE = 1000
+
+    # Least recently used previews beyond this count are deleted after each generation
+    MAX_CACHED_PREVIEWS = 200
+
     def __init__(self, tts_service):
         """
         Initialize voice selector
@@ -35,10 +78,16 @@ class VoiceSelector:
         self.preview_cache_dir = Path(tempfile.gettempdir()) / "voice_previews"
         self.preview_cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize pygame mixer for audio playback
+        # In-flight preview generations by cache file name, shared by prewarm and preview
+        self._generation_tasks: Dict[str, asyncio.Future] = {}
+
+        # Initialize pygame mixer for audio playback (imported here, as it loads the SDL libraries)
         self.audio_available = False
+        self._pygame = None
         try:
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            import pygame
+            pygame.mixer.init(frequency=_MIXER_FREQUENCY, size=-16, channels=2, buffer=_MIXER_BUFFER)
+            self._pygame = pygame
             self.audio_available = True
             logger.info("Audio playback initialized successfully")
         except Exception as e:
@@ -49,7 +98,7 @@ class VoiceSelector:
         """Cleanup pygame mixer"""
         try:
             if self.audio_available:
-                pygame.mixer.quit()
+                self._pygame.mixer.quit()
         except:
             pass
 
@@ -80,85 +129,110 @@ class VoiceSelector:
         # Show instructions
         self._show_instructions()
 
+        import inquirer
+        from inquirer import themes
+
         # Prepare choices for inquirer
         choices = self._prepare_choices(voices, current_voice)
 
-        # Interactive selection loop
-        while True:
-            try:
-                # Use inquirer for arrow-key selection
-                questions = [
-                    inquirer.List(
-                        'voice',
-                        message=f"Select voice for {language} (↑↓ to navigate, Enter to preview, 's' to select)",
-                        choices=choices,
-                        carousel=True
-                    )
-                ]
-
-                # Custom theme for better visibility
-                custom_theme = themes.GreenPassion()
+        # Generate previews in the background so most are cached before they are requested
+        prewarm_task = None
+        if self.audio_available:
+            prewarm_task = asyncio.ensure_future(self._prewarm_previews(voices, language))
 
-                answer = inquirer.prompt(questions, theme=custom_theme)
-
-                if not answer:
-                    # User cancelled (Ctrl+C)
+        try:
+            # Interactive selection loop
+            while True:
+                try:
+                    # Use inquirer for arrow-key selection
+                    questions = [
+                        inquirer.List(
+                            'voice',
+                            message=f"Select voice for {language} (↑↓ to navigate, Enter to preview, 's' to select)",
+                            choices=choices,
+                            carousel=True
+                        )
+                    ]
+
+                    # Custom theme for better visibility
+                    custom_theme = themes.GreenPassion()
+
+                    answer = await self._prompt(questions, custom_theme)
+
+                    if not answer:
+                        # User cancelled (Ctrl+C)
+                        return None
+
+                    selected_value = answer['voice']
+
+                    # Check if user wants to preview or select
+                    if selected_value == '__default__':
+                        # User selected default
+                        return self.tts_service.best_voices.get(language, "en-US-AvaMultilingualNeural")
+                    elif selected_value == '__cancel__':
+                        return None
+                    elif isinstance(selected_value, int):
+                        selected_voice = voices[selected_value]
+
+                        # Action menu loop - stay here until user selects or goes back
+                        while True:
+                            # Ask user: Preview or Select?
+                            action_questions = [
+                                inquirer.List(
+                                    'action',
+                                    message=f"Voice: {selected_voice['name']}",
+                                    choices=[
+                                        ('🎧 Preview this voice', 'preview'),
+                                        ('✓ Select this voice', 'select'),
+                                        ('← Back to list', 'back')
+                                    ]
+                                )
+                            ]
+
+                            action_answer = await self._prompt(action_questions, custom_theme)
+
+                            if not action_answer or action_answer['action'] == 'back':
+                                # Go back to voice list
+                                break
+                            elif action_answer['action'] == 'preview':
+                                # Generate and play preview (if audio available)
+                                if self.audio_available:
+                                    await self._play_preview(selected_voice, language)
+                                else:
+                                    console.print("[yellow]⚠ Audio preview not available on this system[/yellow]")
+                                    console.print(f"[dim]Would have previewed: {selected_voice['name']}[/dim]")
+                                # Loop back to action menu (not voice list!)
+                                continue
+                            elif action_answer['action'] == 'select':
+                                # User confirmed selection
+                                console.print(f"[green]✓ Selected voice: {selected_voice['name']}[/green]")
+                                return selected_voice['short_name']
+
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Voice selection cancelled[/yellow]")
+                    return None
+                except Exception as e:
+                    logger.error(f"Error in voice selection: {e}")
+                    console.print(f"[red]Error: {e}[/red]")
                     return None
+        finally:
+            if prewarm_task is not None:
+                prewarm_task.cancel()
 
-                selected_value = answer['voice']
+    @staticmethod
+    async def _prompt(questions: list, theme) -> Optional[Dict]:
+        """
+        Run a blocking inquirer prompt in a worker thread
 
-                # Check if user wants to preview or select
-                if selected_value == 'default':
-                    # User selected default
-                    return self.tts_service.best_voices.get(language, "en-US-AvaMultilingualNeural")
-                elif selected_value == 'cancel':
-                    return None
-                else:
-                    # Extract voice index from the value
-                    voice_index = int(selected_value.split('_')[1])
-                    selected_voice = voices[voice_index]
-
-                    # Action menu loop - stay here until user selects or goes back
-                    while True:
-                        # Ask user: Preview or Select?
-                        action_questions = [
-                            inquirer.List(
-                                'action',
-                                message=f"Voice: {selected_voice['name']}",
-                                choices=[
-                                    ('🎧 Preview this voice', 'preview'),
-                                    ('✓ Select this voice', 'select'),
-                                    ('← Back to list', 'back')
-                                ]
-                            )
-                        ]
-
-                        action_answer = inquirer.prompt(action_questions, theme=custom_theme)
-
-                        if not action_answer or action_answer['action'] == 'back':
-                            # Go back to voice list
-                            break
-                        elif action_answer['action'] == 'preview':
-                            # Generate and play preview (if audio available)
-                            if self.audio_available:
-                                await self._play_preview(selected_voice, language)
-                            else:
-                                console.print("[yellow]⚠ Audio preview not available on this system[/yellow]")
-                                console.print(f"[dim]Would have previewed: {selected_voice['name']}[/dim]")
-                            # Loop back to action menu (not voice list!)
-                            continue
-                        elif action_answer['action'] == 'select':
-                            # User confirmed selection
-                            console.print(f"[green]✓ Selected voice: {selected_voice['name']}[/green]")
-                            return selected_voice['short_name']
-
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Voice selection cancelled[/yellow]")
-                return None
-            except Exception as e:
-                logger.error(f"Error in voice selection: {e}")
-                console.print(f"[red]Error: {e}[/red]")
-                return None
+        Keeps the event loop free while the user is browsing, so background
+        preview generation can make progress. Console logging is muted meanwhile,
+        as background log lines would break the prompt's redraw.
+        """
+        import inquirer
+
+        loop = asyncio.get_running_loop()
+        with suppress_console_logs():
+            return await loop.run_in_executor(None, functools.partial(inquirer.prompt, questions, theme=theme))
 
     def _display_voice_table(self, voices: List[Dict], language: str):
         """Display available voices in a formatted table"""
@@ -216,26 +290,20 @@ class VoiceSelector:
         Returns:
             List of tuples (display_name, value)
         """
-        choices = []
-
-        for i, voice in enumerate(voices):
-            name = voice.get('name', 'Unknown')
-            gender = voice.get('gender', 'Unknown')
-            locale = voice.get('locale', 'Unknown')
-            short_name = voice.get('short_name', '')
-
-            # Mark current voice if editing
-            marker = " [CURRENT]" if short_name == current_voice else ""
-
-            display = f"{i+1:3d}. {name} ({gender}, {locale}){marker}"
-            value = f"voice_{i}"  # Use index as value
-
-            choices.append((display, value))
+        # Use index as value; mark current voice if editing
+        choices = [
+            (
+                f"{i + 1:3d}. {get('name', 'Unknown')} ({get('gender', 'Unknown')}, {get('locale', 'Unknown')})"
+                + (" [CURRENT]" if get('short_name', '') == current_voice else ""),
+                i
+            )
+            for i, get in enumerate(voice.get for voice in voices)
+        ]
 
         # Add default and cancel options
-        choices.append(("─" * 50, 'separator'))
-        choices.append(("Use default voice", 'default'))
-        choices.append(("Cancel", 'cancel'))
+        choices.append(("─" * 50, '__sep__'))
+        choices.append(("Use default voice", '__default__'))
+        choices.append(("Cancel", '__cancel__'))
 
         return choices
 
@@ -261,56 +329,34 @@ class VoiceSelector:
             # Generate preview text based on language
             preview_text = self._get_preview_text(language)
 
-            # Use safer filename (replace problematic chars)
-            safe_name = short_name.replace('/', '_').replace('\\', '_')
-            cache_file = self.preview_cache_dir / f"{safe_name}.mp3"
-
-            # Check if we need to generate
-            needs_generation = not cache_file.exists() or cache_file.stat().st_size < 1000
-
-            if needs_generation:
-                # Remove corrupt cache if exists
-                if cache_file.exists():
-                    cache_file.unlink()
-                    logger.info("Removed corrupt cache file")
-
-                # Generate preview audio
-                import edge_tts
+            cache_file = self._preview_cache_file(short_name, language, preview_text)
 
+            audio_data = None
+            if self._is_preview_cached(cache_file):
+                logger.info(f"Using cached preview: {cache_file}")
+                # Mark as recently used for cache eviction
                 try:
-                    communicate = edge_tts.Communicate(
-                        text=preview_text,
-                        voice=short_name
-                    )
-
-                    await communicate.save(str(cache_file))
-
-                    # Verify file was created successfully
-                    if not cache_file.exists() or cache_file.stat().st_size < 1000:
-                        raise Exception("Audio generation produced no output or file too small")
-
-                    logger.info(f"Generated preview audio: {cache_file}")
-
-                except Exception as gen_err:
-                    # Clean up failed attempt
-                    if cache_file.exists():
-                        cache_file.unlink()
-                    raise Exception(f"Audio generation failed: {gen_err}")
-
+                    os.utime(cache_file)
+                except OSError:
+                    pass
             else:
-                logger.info(f"Using cached preview: {cache_file}")
+                # Generate preview audio (or wait for the background generation already running)
+                audio_data = await self._generate_preview(short_name, cache_file, preview_text)
 
-            # Play the audio
+            # Play the audio (freshly generated audio is played from memory, not read back from disk)
             console.print("[green]▶ Playing preview...[/green]")
             try:
-                self._play_audio_file(str(cache_file))
+                source = io.BytesIO(audio_data) if audio_data is not None else str(cache_file)
+                await self._play_audio_file(source)
                 console.print("[green]✓ Preview complete[/green]\n")
             except Exception as play_err:
                 # If playback fails, remove corrupt cache
                 logger.error(f"Playback failed: {play_err}")
-                if cache_file.exists():
+                try:
                     cache_file.unlink()
                     logger.info("Removed corrupt audio file")
+                except FileNotFoundError:
+                    pass
                 raise Exception(f"Audio playback failed: {play_err}")
 
         except Exception as e:
@@ -319,7 +365,143 @@ class VoiceSelector:
             console.print(f"[dim]Voice: {voice_name}[/dim]")
             console.print(f"[dim]You can still select this voice - it will work for actual generation[/dim]\n")
 
-    def _get_preview_text(self, language: str) -> str:
+    def _preview_cache_file(self, short_name: str, language: str, preview_text: str) -> Path:
+        """
+        Get the cache file path for a voice preview
+
+        Keyed by voice, language and text, so a multilingual voice gets a separate
+        preview per language (and edited preview texts are regenerated).
+        """
+        key = hashlib.blake2b(f"{short_name}|{language}|{preview_text}".encode(), digest_size=8).hexdigest()
+        return self.preview_cache_dir / f"{key}.mp3"
+
+    def _evict_old_previews(self):
+        """Delete the least recently used previews beyond MAX_CACHED_PREVIEWS"""
+        try:
+            with os.scandir(self.preview_cache_dir) as it:
+                previews = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it if entry.name.endswith('.mp3')
+                ]
+        except OSError as e:
+            logger.debug(f"Could not scan preview cache: {e}")
+            return
+
+        if len(previews) <= self.MAX_CACHED_PREVIEWS:
+            return
+
+        previews.sort()
+        for _, path in previews[:-self.MAX_CACHED_PREVIEWS]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _is_preview_cached(self, cache_file: Path) -> bool:
+        """Check whether a usable preview file exists"""
+        try:
+            return cache_file.stat().st_size >= self.MIN_PREVIEW_SIZE
+        except OSError:
+            return False
+
+    def _generate_preview(self, short_name: str, cache_file: Path, preview_text: str) -> asyncio.Future:
+        """
+        Start generating a voice preview, or join the generation already in progress
+
+        Returns:
+            Awaitable resolving to the preview audio bytes once the preview file is written
+        """
+        key = cache_file.name
+        task = self._generation_tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_one(short_name, cache_file, preview_text))
+            self._generation_tasks[key] = task
+            task.add_done_callback(lambda _: self._generation_tasks.pop(key, None))
+        return task
+
+    async def _generate_preview_bytes(self, short_name: str, preview_text: str) -> bytes:
+        """Stream a voice preview from edge-tts into memory"""
+        import edge_tts
+
+        communicate = edge_tts.Communicate(
+            text=preview_text,
+            voice=short_name
+        )
+
+        buffer = io.BytesIO()
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                buffer.write(chunk["data"])
+        return buffer.getvalue()
+
+    async def _generate_one(self, short_name: str, cache_file: Path, preview_text: str) -> bytes:
+        """
+        Generate one voice preview with edge-tts and persist it to the cache
+
+        The audio is written to a temporary file and moved into place once complete,
+        so a partially written preview is never played.
+
+        Returns:
+            The generated audio bytes
+        """
+        tmp_file = cache_file.with_name(cache_file.name + ".part")
+        try:
+            audio_data = await self._generate_preview_bytes(short_name, preview_text)
+
+            if len(audio_data) < self.MIN_PREVIEW_SIZE:
+                raise Exception("Audio generation produced no output or file too small")
+
+            tmp_file.write_bytes(audio_data)
+            os.replace(tmp_file, cache_file)
+            logger.debug(f"Generated preview audio: {cache_file}")
+
+            self._evict_old_previews()
+            return audio_data
+
+        except BaseException as gen_err:
+            # Clean up failed (or cancelled) attempt
+            try:
+                tmp_file.unlink()
+            except FileNotFoundError:
+                pass
+            if isinstance(gen_err, Exception):
+                raise Exception(f"Audio generation failed: {gen_err}")
+            raise
+
+    async def _prewarm_previews(self, voices: List[Dict], language: str):
+        """Generate missing previews for the first PREWARM_MAX_VOICES voices concurrently"""
+        preview_text = self._get_preview_text(language)
+        semaphore = asyncio.Semaphore(self.PREWARM_CONCURRENCY)
+
+        async def prewarm(short_name: str, cache_file: Path):
+            async with semaphore:
+                # The user may have previewed this voice while we waited
+                if self._is_preview_cached(cache_file):
+                    return
+                try:
+                    await self._generate_preview(short_name, cache_file, preview_text)
+                except Exception as e:
+                    logger.debug(f"Background preview generation failed for {short_name}: {e}")
+
+        # One directory scan instead of a stat() per voice
+        try:
+            with os.scandir(self.preview_cache_dir) as it:
+                cached_sizes = {entry.name: entry.stat().st_size for entry in it}
+        except OSError:
+            cached_sizes = {}
+
+        pending = []
+        for voice in voices[:self.PREWARM_MAX_VOICES]:
+            short_name = voice.get('short_name', '')
+            if short_name:
+                cache_file = self._preview_cache_file(short_name, language, preview_text)
+                if cached_sizes.get(cache_file.name, 0) < self.MIN_PREVIEW_SIZE:
+                    pending.append(prewarm(short_name, cache_file))
+
+        await asyncio.gather(*pending)
+
+    @staticmethod
+    def _get_preview_text(language: str) -> str:
         """
         Get preview text in the appropriate language
 
@@ -329,56 +511,58 @@ class VoiceSelector:
         Returns:
             Preview text string
         """
-        preview_texts = {
-            'en': "Hello! This is a voice preview. How do you like this voice?",
-            'hi': "नमस्ते! यह एक आवाज़ का पूर्वावलोकन है। आपको यह आवाज़ कैसी लगी?",
-            'ta': "வணக்கம்! இது குரல் முன்னோட்டம். இந்த குரல் உங்களுக்கு எப்படி உள்ளது?",
-            'te': "నమస్కారం! ఇది వాయిస్ ప్రివ్యూ. ఈ వాయిస్ మీకు ఎలా అనిపిస్తుంది?",
-            'kn': "ನಮಸ್ಕಾರ! ಇದು ಧ್ವನಿ ಪೂರ್ವವೀಕ್ಷಣೆ. ಈ ಧ್ವನಿ ನಿಮಗೆ ಹೇಗೆ ಅನಿಸುತ್ತದೆ?",
-            'ml': "നമസ്കാരം! ഇതൊരു ശബ്ദ പ്രിവ്യൂ ആണ്. ഈ ശബ്ദം നിങ്ങൾക്ക് എങ്ങനെയുണ്ട്?",
-            'fr': "Bonjour! Ceci est un aperçu vocal. Comment aimez-vous cette voix?",
-            'es': "¡Hola! Esta es una vista previa de voz. ¿Cómo te gusta esta voz?",
-            'de': "Hallo! Dies ist eine Sprachvorschau. Wie gefällt Ihnen diese Stimme?",
-            'ko': "안녕하세요! 이것은 음성 미리보기입니다. 이 목소리가 어떻습니까?",
-            'ja': "こんにちは！これは音声プレビューです。この声はいかがですか？",
-            'zh': "你好！这是语音预览。你觉得这个声音怎么样？",
-            'ar': "مرحبا! هذه معاينة صوتية. كيف تحب هذا الصوت؟",
-            'ru': "Привет! Это предварительный просмотр голоса. Как вам этот голос?",
-            'pt': "Olá! Esta é uma prévia de voz. Como você gosta dessa voz?",
-            'it': "Ciao! Questa è un'anteprima vocale. Come ti piace questa voce?"
-        }
-
-        return preview_texts.get(
-            language.lower(),
-            "Hello! This is a voice preview. How do you like this voice?"
-        )
+        return _PREVIEW_TEXTS.get(language.lower(), _DEFAULT_PREVIEW_TEXT)
 
-    def _play_audio_file(self, file_path: str):
+    async def _play_audio_file(self, source: Union[str, BinaryIO]):
         """
-        Play an audio file using pygame mixer
+        Play an MP3 file using pygame mixer
 
         Args:
-            file_path: Path to audio file
+            source: Path to audio file, or a file-like object with the MP3 data
         """
         try:
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
+            music = self._pygame.mixer.music
+            if isinstance(source, str):
+                music.load(source)
+            else:
+                music.load(source, "mp3")
+            music.play()
 
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
+            # Wait for playback to finish, letting background preview generation run meanwhile
+            while music.get_busy():
+                await asyncio.sleep(0.05)
 
         except Exception as e:
             logger.error(f"Error playing audio: {e}")
             raise
 
-    def cleanup_cache(self):
-        """Clean up preview audio cache"""
+    def cleanup_cache(self, older_than_days: Optional[float] = None):
+        """
+        Clean up preview audio cache
+
+        The directory itself is kept, and in-progress (.part) files are left
+        alone so a running generation is not broken.
+
+        Args:
+            older_than_days: Only remove previews not used for this many days
+        """
+        cutoff = time.time() - older_than_days * 86400 if older_than_days is not None else None
+        removed = 0
         try:
-            import shutil
-            if self.preview_cache_dir.exists():
-                shutil.rmtree(self.preview_cache_dir)
-                logger.info("Voice preview cache cleaned up")
+            with os.scandir(self.preview_cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.part') or not entry.is_file():
+                        continue
+                    try:
+                        if cutoff is not None and entry.stat().st_mtime >= cutoff:
+                            continue
+                        os.unlink(entry.path)
+                        removed += 1
+                    except FileNotFoundError:
+                        pass
+            logger.info(f"Voice preview cache cleaned up ({removed} files removed)")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Could not clean up preview cache: {e}")
 